@@ -0,0 +1,79 @@
+# benchmark_serialization.py
+"""
+Micro-benchmark comparing the two ways of rendering GET /vendors:
+what FastAPI did for response_model=List[VendorResponse] (validate each
+item, dump to JSON-compatible Python, then stdlib json.dumps) versus the
+projection + orjson fast path. Uses synthetic documents, so it needs
+neither MongoDB nor an API key.
+
+Run: python benchmark_serialization.py [number_of_vendors]
+"""
+import json
+import sys
+import timeit
+from datetime import datetime
+from typing import List
+
+from bson.objectid import ObjectId
+from pydantic import TypeAdapter
+
+from serialization import VENDOR_PROJECTION, VendorResponse, vendors_to_json
+
+
+def make_vendors(count: int) -> List[dict]:
+    now = datetime.now()
+    return [
+        {
+            "_id": ObjectId(),
+            "vendor_type": "Driver",
+            "business_name": f"Gujarat Cabs {i}",
+            "contact_name": "Suresh Patel",
+            "mobile_number": "9876543210",
+            "city": "Ahmedabad",
+            "summary": "AC Sedan for local tours.",
+            "registration_date": now,
+        }
+        for i in range(count)
+    ]
+
+
+vendor_list_adapter = TypeAdapter(List[VendorResponse])
+
+
+def pydantic_path(vendors: List[dict]) -> bytes:
+    # Mirrors fastapi.routing.serialize_response followed by JSONResponse.render
+    validated = vendor_list_adapter.validate_python(vendors)
+    content = vendor_list_adapter.dump_python(validated, mode="json", by_alias=True)
+    return json.dumps(
+        content, ensure_ascii=False, allow_nan=False, indent=None, separators=(",", ":")
+    ).encode("utf-8")
+
+
+def fast_path(vendors: List[dict]) -> bytes:
+    return vendors_to_json(vendors)
+
+
+def main():
+    count = int(sys.argv[1]) if len(sys.argv) > 1 else 5000
+    vendors = make_vendors(count)
+    assert set(VENDOR_PROJECTION) | {"_id"} == set(vendors[0])
+
+    for name, render in (("pydantic", pydantic_path), ("orjson", fast_path)):
+        # vendors_to_json converts "_id" in place, so each run gets fresh
+        # documents like Mongo would return. The copy is made in setup,
+        # outside the timed call.
+        namespace = {"render": render, "vendors": vendors}
+        seconds = min(
+            timeit.repeat(
+                "render(batch)",
+                setup="batch = [dict(vendor) for vendor in vendors]",
+                number=1,
+                repeat=20,
+                globals=namespace,
+            )
+        )
+        print(f"{name:>8}: {seconds * 1000:.2f} ms per {count} vendors")
+
+
+if __name__ == "__main__":
+    main()
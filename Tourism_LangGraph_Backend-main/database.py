@@ -2,6 +2,7 @@ import pymongo
 from pymongo.mongo_client import MongoClient
 from bson.objectid import ObjectId
 from datetime import datetime
+from typing import Optional
 
 try:
     client = MongoClient("mongodb://localhost:27017")
@@ -30,13 +31,13 @@ def find_vendor_by_id(vendor_id: str) -> dict:
         return None
 
 
-def find_vendor_by_type(vendor_type: str) -> list:
-    vendors = vendors_collection.find({"vendor_type": vendor_type})
+def find_vendor_by_type(vendor_type: str, projection: Optional[dict] = None) -> list:
+    vendors = vendors_collection.find({"vendor_type": vendor_type}, projection)
     return list(vendors)
 
 
-def find_all_vendors() -> list:
-    vendors = vendors_collection.find({})
+def find_all_vendors(projection: Optional[dict] = None) -> list:
+    vendors = vendors_collection.find({}, projection)
     return list(vendors)
 
 
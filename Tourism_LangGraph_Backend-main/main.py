@@ -1,15 +1,13 @@
 # main.py
-from datetime import datetime
 import os
 import json
 import operator
 from typing import TypedDict, Annotated, List, Optional
 
-from pydantic import BeforeValidator
-from typing_extensions import Annotated
-
 from fastapi import FastAPI, HTTPException
 from fastapi.middleware.cors import CORSMiddleware
+from fastapi.middleware.gzip import GZipMiddleware
+from fastapi.responses import ORJSONResponse, Response
 from pydantic import BaseModel, Field
 from dotenv import load_dotenv
 from database import (
@@ -20,6 +18,7 @@ from database import (
     find_all_vendors,
     find_vendors_by_city_and_type,
 )
+from serialization import VENDOR_PROJECTION, VendorResponse, vendors_to_json
 
 from langchain_google_genai import ChatGoogleGenerativeAI
 from langchain_core.messages import HumanMessage, AIMessage, BaseMessage
@@ -245,8 +244,8 @@ app.add_middleware(
     allow_headers=["*"],
 )
 
-
-PyObjectId = Annotated[str, BeforeValidator(str)]
+# Compress large payloads such as full vendor listings; small ones are not worth it
+app.add_middleware(GZipMiddleware, minimum_size=1000)
 
 
 # --- Request Models ---
@@ -276,22 +275,6 @@ class ChatResponse(BaseModel):
     is_finished: bool
 
 
-class VendorResponse(BaseModel):
-    # This model is now complete and correctly handles ObjectId
-    id: PyObjectId = Field(alias="_id", default=None)
-    vendor_type: str
-    business_name: str
-    contact_name: str
-    mobile_number: str
-    city: str
-    summary: str
-    registration_date: datetime
-
-    class Config:
-        populate_by_name = True
-        arbitrary_types_allowed = True
-
-
 @app.post("/chat", response_model=ChatResponse)
 async def chat_endpoint(request: ChatRequest):
     """Main API endpoint for the chat agent."""
@@ -313,11 +296,13 @@ async def chat_endpoint(request: ChatRequest):
     next_action = final_state.get("next_action", "")
     is_finished = next_action == "finished"
 
-    return ChatResponse(
+    # Validate through ChatResponse, then render with orjson
+    response = ChatResponse(
         ai_message=ai_response_message,
         next_action=next_action,
         is_finished=is_finished,
     )
+    return ORJSONResponse(response.model_dump())
 
 
 @app.get("/")
@@ -346,8 +331,9 @@ async def register_vendor(vendor_data: VendorRegistrationRequest):
 
 @app.get("/vendors", response_model=List[VendorResponse])
 async def get_vendors(vendor_type: Optional[str] = None):
+    # Mongo shapes the documents, so we skip per-item VendorResponse validation
     if vendor_type:
-        vendors = find_vendor_by_type(vendor_type)
+        vendors = find_vendor_by_type(vendor_type, VENDOR_PROJECTION)
     else:
-        vendors = find_all_vendors()
-    return vendors
\ No newline at end of file
+        vendors = find_all_vendors(VENDOR_PROJECTION)
+    return Response(vendors_to_json(vendors), media_type="application/json")
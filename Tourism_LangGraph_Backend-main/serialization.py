@@ -0,0 +1,47 @@
+# serialization.py
+from datetime import datetime
+from typing import List
+
+import orjson
+from pydantic import BaseModel, BeforeValidator, Field
+from typing_extensions import Annotated
+
+
+PyObjectId = Annotated[str, BeforeValidator(str)]
+
+
+class VendorResponse(BaseModel):
+    # This model is now complete and correctly handles ObjectId
+    id: PyObjectId = Field(alias="_id", default=None)
+    vendor_type: str
+    business_name: str
+    contact_name: str
+    mobile_number: str
+    city: str
+    summary: str
+    registration_date: datetime
+
+    class Config:
+        populate_by_name = True
+        arbitrary_types_allowed = True
+
+
+# Mongo projection matching VendorResponse, so the database only sends the
+# fields we actually return. "_id" is always included by Mongo.
+VENDOR_PROJECTION = {
+    name: 1 for name in VendorResponse.model_fields if name != "id"
+}
+
+
+def vendors_to_json(vendors: List[dict]) -> bytes:
+    """
+    Fast path for vendor listings. Documents must already be shaped by
+    VENDOR_PROJECTION; only ObjectId needs converting since orjson handles
+    datetime natively. Output matches VendorResponse dumped by alias.
+
+    Note: "_id" is replaced with its string form in place, so the given
+    documents are modified. This avoids copying every document.
+    """
+    for vendor in vendors:
+        vendor["_id"] = str(vendor["_id"])
+    return orjson.dumps(vendors)